@@ -1,52 +1,80 @@
+import logging
+from contextlib import asynccontextmanager
+
+import orjson
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
-from src.common.config import API_HOST, API_PORT, init_directories
+from src.api.middleware import AllowAllCORSMiddleware
+from src.common.config import API_HOST, API_PORT, API_WORKERS, ENV, init_directories
 from src.common.logger import setup_logger
 
 # ロガーの設定
 logger = setup_logger("api")
+# ログレベルはsetup_loggerで固定されるため、DEBUG判定は起動時に一度だけ行う
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
+# 固定レスポンスの本文（インポート時に一度だけエンコードする）
+ROOT_RESPONSE_BODY = orjson.dumps({"message": "Welcome to Knowledge Acquisition System API"})
+HEALTH_RESPONSE_BODY = orjson.dumps({"status": "healthy"})
+
+# 起動・終了時の処理
+@asynccontextmanager
+async def lifespan(app):
+    """アプリケーションのライフサイクル管理"""
+    logger.info("Starting Knowledge Acquisition System API")
+    init_directories()
+    logger.info("Initialization completed")
+    yield
 
 # アプリケーションの初期化
 app = FastAPI(
     title="Knowledge Acquisition System API",
     description="情報収集・知識管理サブシステム API",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORSミドルウェアの設定
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(AllowAllCORSMiddleware)
 
-# 起動時の初期化
-@app.on_event("startup")
-async def startup_event():
-    """アプリケーション起動時の処理"""
-    logger.info("Starting Knowledge Acquisition System API")
-    init_directories()
-    logger.info("Initialization completed")
+# レスポンス圧縮（小さなレスポンスは圧縮しない）
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # ルートエンドポイント
 @app.get("/")
 async def root():
     """APIルートエンドポイント"""
-    logger.debug("Root endpoint accessed")
-    return {"message": "Welcome to Knowledge Acquisition System API"}
+    if _DEBUG:
+        logger.debug("Root endpoint accessed")
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 # ヘルスチェックエンドポイント
 @app.get("/health")
 async def health_check():
     """ヘルスチェックエンドポイント"""
-    logger.debug("Health check accessed")
-    return {"status": "healthy"}
+    if _DEBUG:
+        logger.debug("Health check accessed")
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 # アプリケーションの実行
 if __name__ == "__main__":
     import uvicorn
-    logger.info(f"Starting uvicorn server on {API_HOST}:{API_PORT}")
-    uvicorn.run(app, host=API_HOST, port=API_PORT)
\ No newline at end of file
+    logger.info(
+        "Starting uvicorn server on %s:%s with %d workers",
+        API_HOST, API_PORT, API_WORKERS,
+    )
+    # 複数ワーカーは同じソケットを共有する（reloadとは併用不可）
+    uvicorn.run(
+        "src.api.main:app",
+        host=API_HOST,
+        port=API_PORT,
+        workers=API_WORKERS,
+        loop="uvloop",
+        http="httptools",
+        # アクセスログはproductionでのみ無効化し、ログレベルはdevelopment以外でwarningにする
+        access_log=(ENV != "production"),
+        log_level=("info" if ENV == "development" else "warning"),
+    )
\ No newline at end of file
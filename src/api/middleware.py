@@ -0,0 +1,121 @@
+ALL_METHODS = (b"DELETE", b"GET", b"HEAD", b"OPTIONS", b"PATCH", b"POST", b"PUT")
+
+# アプリケーションのレスポンスにあれば上書きするCORSヘッダ
+CORS_HEADER_NAMES = frozenset({
+    b"access-control-allow-origin",
+    b"access-control-allow-credentials",
+})
+
+
+class AllowAllCORSMiddleware:
+    """全オリジン・全メソッド・全ヘッダを許可するCORSミドルウェア
+
+    Starletteの ``CORSMiddleware(allow_origins=["*"], allow_methods=["*"],
+    allow_headers=["*"], allow_credentials=True)`` と同じヘッダを返す。
+    ワイルドカード設定に特化し、リクエストごとの ``Headers`` /
+    ``MutableHeaders`` の生成を省いてレスポンスヘッダへ直接マージする。
+
+    Args:
+        app: ラップするASGIアプリケーション
+        max_age (int, optional): プリフライト結果のキャッシュ秒数. デフォルトは600.
+    """
+
+    def __init__(self, app, max_age=600):
+        self.app = app
+        self.preflight_headers = [
+            (b"vary", b"Origin"),
+            (b"access-control-allow-methods", b", ".join(ALL_METHODS)),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        has_cookie = False
+        requested_method = None
+        requested_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"cookie":
+                has_cookie = True
+            elif key == b"access-control-request-method":
+                requested_method = value
+            elif key == b"access-control-request-headers":
+                requested_headers = value
+
+        # Originヘッダのないリクエストはそのまま通す
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if requested_method is not None and scope["method"] == "OPTIONS":
+            await self.preflight_response(send, origin, requested_method, requested_headers)
+            return
+
+        # Cookie付きリクエストには "*" ではなく要求元オリジンを返す必要がある
+        cors_headers = [
+            (b"access-control-allow-origin", origin if has_cookie else b"*"),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = merge_cors_headers(
+                    message.get("headers", []), cors_headers, vary_origin=has_cookie
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def preflight_response(self, send, origin, requested_method, requested_headers):
+        """プリフライトリクエストにアプリケーションを経由せず応答する
+
+        許可されていないメソッドが要求された場合は400を返す。
+        """
+        if requested_method in ALL_METHODS:
+            status, body = 200, b"OK"
+        else:
+            status, body = 400, b"Disallowed CORS method"
+        headers = [(b"access-control-allow-origin", origin)]
+        headers.extend(self.preflight_headers)
+        if requested_headers is not None:
+            headers.append((b"access-control-allow-headers", requested_headers))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def merge_cors_headers(headers, cors_headers, vary_origin=False):
+    """レスポンスヘッダにCORSヘッダをマージする
+
+    既存のCORSヘッダは置き換え、Varyヘッダには "Origin" を追記する。
+
+    Args:
+        headers (list): アプリケーションのレスポンスヘッダ
+        cors_headers (list): 付与するCORSヘッダ
+        vary_origin (bool, optional): Varyヘッダに "Origin" を追加するか. デフォルトはFalse.
+
+    Returns:
+        list: マージ後のレスポンスヘッダ
+    """
+    merged = []
+    vary = None
+    for key, value in headers:
+        name = key.lower()
+        if name in CORS_HEADER_NAMES:
+            continue
+        if vary_origin and name == b"vary":
+            if vary is None:
+                vary = value
+            continue
+        merged.append((key, value))
+    merged.extend(cors_headers)
+    if vary_origin:
+        merged.append((b"vary", b"Origin" if vary is None else vary + b", Origin"))
+    return merged
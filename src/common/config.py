@@ -6,22 +6,40 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # 基本設定
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-LOG_DIR = os.path.join(BASE_DIR, "logs")
-DATA_DIR = os.path.join(BASE_DIR, "data")
+BASE_DIR = Path(__file__).parent.parent.parent
+_DATA_PATH = BASE_DIR / "data"
+LOG_DIR = str(BASE_DIR / "logs")
+DATA_DIR = str(_DATA_PATH)
 
 # APIサーバー設定
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
 API_PORT = int(os.getenv("API_PORT", "8000"))
 ENV = os.getenv("ENV", "development")
 
+def _default_api_workers():
+    """APIワーカー数のデフォルト値を決定する
+
+    開発環境では1、それ以外ではプロセスが使用可能なCPU数を返す
+    （os.cpu_countはcpusetによるCPU割り当てを考慮しないため）。
+
+    Returns:
+        int: ワーカー数
+    """
+    if ENV == "development":
+        return 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+API_WORKERS = int(os.getenv("API_WORKERS", str(_default_api_workers())))
+
 # データベース設定
 DB_TYPE = os.getenv("DB_TYPE", "sqlite")
-DB_PATH = os.getenv("DB_PATH", os.path.join(DATA_DIR, "knowledge.db"))
+DB_PATH = os.getenv("DB_PATH", str(_DATA_PATH / "knowledge.db"))
 
 # ベクトルデータベース設定
 VECTOR_DB_TYPE = os.getenv("VECTOR_DB_TYPE", "faiss")
-VECTOR_DB_PATH = os.getenv("VECTOR_DB_PATH", os.path.join(DATA_DIR, "vector_store"))
+VECTOR_DB_PATH = os.getenv("VECTOR_DB_PATH", str(_DATA_PATH / "vector_store"))
 
 # LLM設定
 LLM_API_KEY = os.getenv("LLM_API_KEY", "")
@@ -30,6 +48,5 @@ LLM_MODEL = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
 # 初期化関数
 def init_directories():
     """必要なディレクトリを作成する"""
-    os.makedirs(LOG_DIR, exist_ok=True)
-    os.makedirs(DATA_DIR, exist_ok=True)
-    os.makedirs(VECTOR_DB_PATH, exist_ok=True)
\ No newline at end of file
+    for directory in (LOG_DIR, DATA_DIR, VECTOR_DB_PATH):
+        os.makedirs(directory, exist_ok=True)
\ No newline at end of file
@@ -1,11 +1,19 @@
+import atexit
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# ロガー名ごとのQueueListener（GCで停止しないよう保持する）
+_listeners = {}
 
 def setup_logger(name, log_file=None, level=logging.INFO):
     """ロガーのセットアップ関数
 
+    出力処理はバックグラウンドスレッドのQueueListenerが行い、
+    ロガー本体にはキューへ積むだけのQueueHandlerを設定する。
+
     Args:
         name (str): ロガー名
         log_file (str, optional): ログファイルパス. デフォルトはNone.
@@ -24,16 +32,27 @@ def setup_logger(name, log_file=None, level=logging.INFO):
         # コンソールハンドラ
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # ファイルハンドラ（指定時のみ）
         if log_file:
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
             file_handler = RotatingFileHandler(log_file, maxBytes=10485760, backupCount=5)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        # 実際の出力はQueueListenerのスレッドで行う
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        _listeners[name] = listener
+        logger.addHandler(QueueHandler(log_queue))
+        
+        # 親ロガー（root）のハンドラで二重に出力しない
+        logger.propagate = False
     
     return logger
 
 # デフォルトロガー
-default_logger = setup_logger('knowledge_acquisition')
\ No newline at end of file
+default_logger = setup_logger('knowledge_acquisition')
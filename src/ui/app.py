@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 from common.logger import setup_logger
 from common.config import API_HOST, API_PORT
 
@@ -24,15 +25,23 @@ page = st.sidebar.radio(
     ["ダッシュボード", "データ収集", "知識検索", "設定"]
 )
 
-# APIステータス確認
+# API接続用セッション（スクリプト再実行をまたいで接続を再利用する）
+@st.cache_resource
+def get_api_session():
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+    return session
+
+# APIステータス確認（結果は10秒間キャッシュする）
+@st.cache_data(ttl=10)
 def check_api_status():
     try:
-        response = requests.get(f"http://{API_HOST}:{API_PORT}/health")
+        response = get_api_session().get(f"http://{API_HOST}:{API_PORT}/health", timeout=2)
         if response.status_code == 200:
             return True, response.json()
         return False, {"status": "error", "code": response.status_code}
     except Exception as e:
-        logger.error(f"API接続エラー: {str(e)}")
+        logger.error("API接続エラー: %s", e)
         return False, {"status": "error", "message": str(e)}
 
 # メインコンテンツ
@@ -1,8 +1,15 @@
 import pytest
 from fastapi.testclient import TestClient
+from src.api import main
 from src.api.main import app
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """テスト用のAPIクライアント"""
-    return TestClient(app)
\ No newline at end of file
+    """テスト用のAPIクライアント（起動・終了処理はセッション中に一度だけ実行）
+
+    起動時のディレクトリ作成はスタブに置き換え、リポジトリ内にディレクトリを作らない。
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(main, "init_directories", lambda: None)
+        with TestClient(app) as test_client:
+            yield test_client
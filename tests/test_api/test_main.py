@@ -1,3 +1,7 @@
+from fastapi.testclient import TestClient
+
+from src.api import main
+
 def test_root_endpoint(client):
     """ルートエンドポイントのテスト"""
     response = client.get("/")
@@ -9,4 +13,11 @@ def test_health_endpoint(client):
     """ヘルスチェックエンドポイントのテスト"""
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "healthy"}
\ No newline at end of file
+    assert response.json() == {"status": "healthy"}
+
+def test_lifespan_initializes_directories(monkeypatch):
+    """起動時にディレクトリ初期化が呼ばれることのテスト"""
+    calls = []
+    monkeypatch.setattr(main, "init_directories", lambda: calls.append(True))
+    with TestClient(main.app):
+        assert calls == [True]
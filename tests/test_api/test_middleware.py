@@ -0,0 +1,129 @@
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+from starlette.middleware.cors import CORSMiddleware
+
+from src.api.main import app
+from src.api.middleware import AllowAllCORSMiddleware, merge_cors_headers
+
+
+async def app_with_vary(scope, receive, send):
+    """Varyと既存のCORSヘッダを返すテスト用ASGIアプリケーション"""
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-length", b"2"),
+            (b"vary", b"Accept"),
+            (b"access-control-allow-origin", b"http://other.example.com"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": b"OK"})
+
+async def app_with_large_body(scope, receive, send):
+    """1KBのレスポンスを返すテスト用ASGIアプリケーション"""
+    body = b"x" * 1024
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-length", str(len(body)).encode("latin-1"))],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+def test_cors_simple_request(client):
+    """Originヘッダ付きリクエストにCORSヘッダが付与されることのテスト"""
+    response = client.get("/health", headers={"Origin": "http://example.com"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+def test_cors_request_with_cookie(client):
+    """Cookie付きリクエストでは要求元オリジンが返されることのテスト"""
+    response = client.get(
+        "/health",
+        headers={"Origin": "http://example.com", "Cookie": "session=abc"},
+    )
+    assert response.headers["access-control-allow-origin"] == "http://example.com"
+    assert response.headers["vary"] == "Origin"
+
+def test_cors_without_origin(client):
+    """Originヘッダのないリクエストにはヘッダが付与されないことのテスト"""
+    response = client.get("/health")
+    assert "access-control-allow-origin" not in response.headers
+
+def test_cors_preflight(client):
+    """プリフライトリクエストのテスト"""
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "X-Custom-Header",
+        },
+    )
+    assert response.status_code == 200
+    assert response.text == "OK"
+    assert response.headers["access-control-allow-origin"] == "http://example.com"
+    assert response.headers["access-control-allow-headers"] == "X-Custom-Header"
+    assert response.headers["access-control-max-age"] == "600"
+
+def test_cors_preflight_disallowed_method(client):
+    """許可されていないメソッドのプリフライトが400になることのテスト"""
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "PROPFIND",
+        },
+    )
+    assert response.status_code == 400
+    assert response.text == "Disallowed CORS method"
+
+def test_cors_headers_match_starlette():
+    """既存のVary/CORSヘッダの扱いがStarletteのCORSMiddlewareと一致することのテスト"""
+    starlette_client = TestClient(CORSMiddleware(
+        app_with_vary,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    ))
+    fast_client = TestClient(AllowAllCORSMiddleware(app_with_vary))
+    for headers in (
+        {"Origin": "http://example.com"},
+        {"Origin": "http://example.com", "Cookie": "session=abc"},
+    ):
+        expected = starlette_client.get("/", headers=headers).headers
+        actual = fast_client.get("/", headers=headers).headers
+        assert sorted(actual.multi_items()) == sorted(expected.multi_items())
+
+def test_merge_cors_headers_appends_origin_to_vary():
+    """Varyヘッダに "Origin" が追記されることのテスト"""
+    merged = merge_cors_headers(
+        [(b"vary", b"Accept")],
+        [(b"access-control-allow-origin", b"http://example.com")],
+        vary_origin=True,
+    )
+    assert merged == [
+        (b"access-control-allow-origin", b"http://example.com"),
+        (b"vary", b"Accept, Origin"),
+    ]
+
+def test_gzip_skips_small_responses(client):
+    """小さなレスポンスが圧縮されないことのテスト"""
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+def test_gzip_middleware_registered():
+    """GZipミドルウェアが指定の設定で登録されていることのテスト"""
+    gzip_middleware = [m for m in app.user_middleware if m.cls is GZipMiddleware]
+    assert len(gzip_middleware) == 1
+    assert gzip_middleware[0].options == {"minimum_size": 1024, "compresslevel": 5}
+
+def test_gzip_compresses_large_responses():
+    """1KB以上のレスポンスが圧縮されることのテスト"""
+    gzip_client = TestClient(
+        GZipMiddleware(app_with_large_body, minimum_size=1024, compresslevel=5)
+    )
+    response = gzip_client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == b"x" * 1024
@@ -0,0 +1,22 @@
+from logging.handlers import QueueHandler
+
+from src.common.logger import _listeners, setup_logger
+
+
+def test_setup_logger_uses_queue_handler(tmp_path):
+    """ロガーにQueueHandlerのみが設定され、ファイルへ出力されることのテスト"""
+    log_file = tmp_path / "logs" / "queue_test.log"
+    logger = setup_logger("test_queue_handler", log_file=str(log_file))
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], QueueHandler)
+    assert logger.propagate is False
+
+    logger.info("queued message")
+    _listeners["test_queue_handler"].queue.join()
+    assert "queued message" in log_file.read_text()
+
+def test_setup_logger_is_idempotent():
+    """同名ロガーの再設定でハンドラが増えないことのテスト"""
+    logger = setup_logger("test_idempotent")
+    assert setup_logger("test_idempotent") is logger
+    assert len(logger.handlers) == 1